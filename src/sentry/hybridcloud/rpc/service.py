@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, NoReturn, Self, TypeVar, cast
 
 import django.urls
+import orjson
 import pydantic
 import requests
 import sentry_sdk
@@ -215,6 +216,10 @@ class RpcService(abc.ABC):
     local implementation).
     """
 
+    # Service instances are stateless method bundles; keeping them dict-less
+    # makes construction and per-call attribute lookup a little cheaper.
+    __slots__ = ()
+
     key: str
     local_mode: SiloMode
 
@@ -559,7 +564,14 @@ class _RemoteSiloCall:
             "meta": {},  # reserved for future use
             "args": self.serial_arguments,
         }
-        data = json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
+        # orjson is substantially faster than sentry.utils.json here and this
+        # runs on every cross-silo call; better_default_encoder still covers
+        # the types orjson doesn't handle natively (sets, Decimal, etc.).
+        data = orjson.dumps(
+            request_body,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            default=json.better_default_encoder,
+        )
         signature = generate_request_signature(self.path, data)
         headers = {
             "Content-Type": f"application/json; charset={_RPC_CONTENT_CHARSET}",
@@ -578,7 +590,7 @@ class _RemoteSiloCall:
             )
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             self._raise_from_response_status_error(response)
 
     @contextmanager
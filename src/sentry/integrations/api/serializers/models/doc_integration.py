@@ -16,14 +16,28 @@ class DocIntegrationSerializer(Serializer):
             targets=item_list, target_type=IntegrationTypes.DOC_INTEGRATION
         )
 
-        # Get associated DocIntegrationAvatar
-        avatars = DocIntegrationAvatar.objects.filter(doc_integration__in=item_list)
+        # Get associated DocIntegrationAvatar, restricted to the columns the
+        # avatar serializer reads so we don't move unused bytes from Postgres
+        avatars = DocIntegrationAvatar.objects.filter(
+            doc_integration_id__in=[item.id for item in item_list]
+        ).only("id", "doc_integration_id", "ident", "avatar_type", "control_file_id")
         doc_avatar_attrs = {avatar.doc_integration_id: avatar for avatar in avatars}
 
+        # Serialize each distinct feature once; features shared across doc
+        # integrations would otherwise be re-serialized for every item.
+        all_features = {
+            feature.id: feature for features in doc_feature_attrs.values() for feature in features
+        }
+        feature_list = list(all_features.values())
+        serialized_features = dict(zip(all_features.keys(), serialize(feature_list, user)))
+
         # Attach both as attrs
         return {
             item: {
-                "features": doc_feature_attrs.get(item.id, set()),
+                "features": [
+                    serialized_features[feature.id]
+                    for feature in doc_feature_attrs.get(item.id, set())
+                ],
                 "avatar": doc_avatar_attrs.get(item.id),
             }
             for item in item_list
@@ -36,7 +50,6 @@ class DocIntegrationSerializer(Serializer):
         user: User,
         **kwargs: Any,
     ) -> Any:
-        features = attrs.get("features")
         data = {
             "name": obj.name,
             "slug": obj.slug,
@@ -45,7 +58,7 @@ class DocIntegrationSerializer(Serializer):
             "url": obj.url,
             "popularity": obj.popularity,
             "isDraft": obj.is_draft,
-            "features": ([serialize(x, user) for x in features] if features else []),
+            "features": attrs.get("features", []),
             "avatar": serialize(attrs.get("avatar"), user),
         }
 
@@ -109,6 +109,8 @@ class SlackIntegrationProvider(IntegrationProvider):
             "commands",
         ]
     )
+    # Sorted once here; build_integration stores scopes in a stable order.
+    _sorted_identity_oauth_scopes = tuple(sorted(identity_oauth_scopes))
     user_scopes = frozenset(
         [
             "links:read",
@@ -159,7 +161,7 @@ class SlackIntegrationProvider(IntegrationProvider):
         team_name = data["team"]["name"]
         team_id = data["team"]["id"]
 
-        scopes = sorted(self.identity_oauth_scopes)
+        scopes = list(self._sorted_identity_oauth_scopes)
         team_data = self._get_team_info(access_token)
 
         metadata = {
@@ -361,4 +361,8 @@ class CheckinProcessingErrorSerializer(Serializer):
     def serialize(
         self, obj: CheckinProcessingError, attrs, user, **kwargs
     ) -> CheckinProcessingErrorData:
-        return obj.to_dict()
+        data = obj.to_dict()
+        # Storage keeps the check-in ts as epoch microseconds, but the API
+        # contract is still an ISO-8601 string.
+        data["checkin"]["ts"] = obj.checkin.ts.isoformat()
+        return data
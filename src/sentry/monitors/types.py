@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import StrEnum
+from functools import lru_cache
 from typing import Literal, NotRequired, TypedDict, Union
 
-from django.utils.functional import cached_property
 from django.utils.text import slugify
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import CheckIn
 
@@ -30,18 +31,44 @@ class CheckinPayload(TypedDict):
     contexts: NotRequired[CheckinContexts]
 
 
+# Check-in timestamps are naive UTC datetimes; integer arithmetic against a
+# naive epoch round-trips them exactly, unlike float timestamp() conversions.
+_EPOCH = datetime(1970, 1, 1)
+
+
+# Slugs that slugify would pass through untouched: ASCII lowercase
+# alphanumerics, underscores and hyphens, with no leading or trailing
+# hyphen/underscore for slugify to strip and no hyphen runs for it to
+# collapse.
+_FAST_SLUG_RE = re.compile(r"\A(?!.*--)[a-z0-9](?:[a-z0-9_-]*[a-z0-9])?\Z")
+
+
+@lru_cache(maxsize=4096)
+def _valid_monitor_slug(monitor_slug: str) -> str:
+    # Already-valid ASCII slugs dominate check-in traffic; skip slugify's
+    # unicode normalization and regex passes for them.
+    if _FAST_SLUG_RE.match(monitor_slug):
+        return monitor_slug[:DEFAULT_SLUG_MAX_LENGTH].strip("-")
+    return slugify(monitor_slug)[:DEFAULT_SLUG_MAX_LENGTH].strip("-")
+
+
 class CheckinItemData(TypedDict):
     """
     See `CheckinItem` for definition
     """
 
-    ts: str
+    ts: int | str
+    """
+    Epoch microseconds. Entries serialized before this became an integer hold
+    an ISO-8601 string; `from_dict` accepts both while those age out.
+    """
+
     partition: int
     message: CheckIn
     payload: CheckinPayload
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckinItem:
     """
     Represents a check-in to be processed
@@ -69,9 +96,20 @@ class CheckinItem:
     the full check-in details.
     """
 
-    @cached_property
+    _processing_key: str | None = field(default=None, init=False, repr=False, compare=False)
+    """
+    Lazily computed cache of `processing_key`, which the consumer reads
+    several times per item while grouping and dispatching check-ins.
+    """
+
+    @property
     def valid_monitor_slug(self):
-        return slugify(self.payload["monitor_slug"])[:DEFAULT_SLUG_MAX_LENGTH].strip("-")
+        # Slugs repeat heavily across check-ins, so the lru_cache on the
+        # module-level helper shares the slugify work across instances rather
+        # than caching per-instance. The payload is not yet validated here, so
+        # coerce like slugify itself would; non-str values would otherwise
+        # raise before any per-item error handling.
+        return _valid_monitor_slug(str(self.payload["monitor_slug"]))
 
     @property
     def processing_key(self):
@@ -80,13 +118,15 @@ class CheckinItem:
         belongs to. Check-ins grouped together will never be processed in
         parallel with other check-ins belonging to the same group
         """
-        project_id = self.message["project_id"]
-        env = self.payload.get("environment")
-        return f"{project_id}:{self.valid_monitor_slug}:{env}"
+        if self._processing_key is None:
+            project_id = self.message["project_id"]
+            env = self.payload.get("environment")
+            self._processing_key = f"{project_id}:{self.valid_monitor_slug}:{env}"
+        return self._processing_key
 
     def to_dict(self) -> CheckinItemData:
         return {
-            "ts": self.ts.isoformat(),
+            "ts": (self.ts - _EPOCH) // timedelta(microseconds=1),
             "partition": self.partition,
             "message": self.message,
             "payload": self.payload,
@@ -94,8 +134,14 @@ class CheckinItem:
 
     @classmethod
     def from_dict(cls, data: CheckinItemData) -> CheckinItem:
+        ts = data["ts"]
+        if isinstance(ts, str):
+            # Errors serialized before ts became epoch microseconds
+            decoded_ts = datetime.fromisoformat(ts)
+        else:
+            decoded_ts = _EPOCH + timedelta(microseconds=ts)
         return cls(
-            datetime.fromisoformat(data["ts"]),
+            decoded_ts,
             data["partition"],
             data["message"],
             data["payload"],
@@ -84,6 +84,8 @@ from sentry.utils.audit import create_org_delete_log
 
 
 class DatabaseBackedOrganizationService(OrganizationService):
+    __slots__ = ()
+
     def check_membership_by_id(
         self, organization_id: int, user_id: int
     ) -> RpcOrganizationMember | None:
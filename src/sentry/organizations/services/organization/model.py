@@ -5,7 +5,7 @@
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from datetime import datetime
 from enum import IntEnum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any
 
 from django.dispatch import Signal
@@ -75,6 +75,15 @@ class RpcTeam(RpcModel):
         }
 
 
+# There are only a handful of team roles, so resolving them once here keeps
+# the lookup off the access-check path that walks every team membership.
+# (A cached_property can't be used: pydantic v1 rejects it as a public class
+# attribute at class-definition time.)
+@lru_cache(maxsize=None)
+def _team_role(role_id: str) -> TeamRole | None:
+    return team_roles.get(role_id)
+
+
 class RpcTeamMember(RpcModel):
     id: int = -1
     slug: str = ""
@@ -86,7 +95,7 @@ class RpcTeamMember(RpcModel):
 
     @property
     def role(self) -> TeamRole | None:
-        return team_roles.get(self.role_id) if self.role_id else None
+        return _team_role(self.role_id) if self.role_id else None
 
 
 class RpcOrganizationMemberTeam(RpcModel):
@@ -98,6 +107,19 @@ class RpcOrganizationMemberTeam(RpcModel):
     role: str | None = None
 
 
+# Unescaped flag names (as used by callers and the ORM bitfield) mapped to
+# their canonical field names, precomputed so flag reads in permission loops
+# don't re-run escape_flag_name per access.
+_MEMBER_FLAG_ALIASES = {
+    "sso:linked": "sso__linked",
+    "sso:invalid": "sso__invalid",
+    "member-limit:restricted": "member_limit__restricted",
+    "idp:provisioned": "idp__provisioned",
+    "idp:role-restricted": "idp__role_restricted",
+    "partnership:restricted": "partnership__restricted",
+}
+
+
 class RpcOrganizationMemberFlags(RpcModel):
     sso__linked: bool = False
     sso__invalid: bool = False
@@ -107,26 +129,25 @@ class RpcOrganizationMemberFlags(RpcModel):
     partnership__restricted: bool = False
 
     def __getattr__(self, item: str) -> bool:
-        from sentry.organizations.services.organization.serial import escape_flag_name
-
-        item = escape_flag_name(item)
-        return bool(getattr(self, item))
+        # Canonical field reads are satisfied from the instance dict by
+        # pydantic; only unescaped aliases like "sso:linked" land here.
+        try:
+            return bool(self.__dict__[_MEMBER_FLAG_ALIASES[item]])
+        except KeyError:
+            raise AttributeError(item)
 
     def __setattr__(self, item: str, value: bool) -> None:
-        from sentry.organizations.services.organization.serial import escape_flag_name
-
-        item = escape_flag_name(item)
-        super().__setattr__(item, value)
+        super().__setattr__(_MEMBER_FLAG_ALIASES.get(item, item), value)
 
     def __getitem__(self, item: str) -> bool:
-        return bool(getattr(self, item))
+        return bool(getattr(self, _MEMBER_FLAG_ALIASES.get(item, item)))
 
 
 class RpcOrganizationMemberSummary(RpcModel):
     id: int = -1
     organization_id: int = -1
     user_id: int | None = None  # This can be null when the user is deleted.
-    flags: RpcOrganizationMemberFlags = Field(default_factory=lambda: RpcOrganizationMemberFlags())
+    flags: RpcOrganizationMemberFlags = Field(default_factory=RpcOrganizationMemberFlags)
 
 
 class RpcOrganizationMember(RpcOrganizationMemberSummary):
@@ -215,9 +236,7 @@ class RpcOrganizationSummary(RpcModel):
     slug: str = ""
     id: int = -1
     name: str = ""
-    flags: RpcOrganizationMappingFlags = Field(
-        default_factory=lambda: RpcOrganizationMappingFlags()
-    )
+    flags: RpcOrganizationMappingFlags = Field(default_factory=RpcOrganizationMappingFlags)
 
     def __hash__(self) -> int:
         # Mimic the behavior of hashing a Django ORM entity, for compatibility with
@@ -273,7 +292,7 @@ class RpcOrganization(RpcOrganizationSummary):
     teams: list[RpcTeam] = Field(default_factory=list)
     projects: list[RpcProject] = Field(default_factory=list)
 
-    flags: RpcOrganizationFlags = Field(default_factory=lambda: RpcOrganizationFlags())
+    flags: RpcOrganizationFlags = Field(default_factory=RpcOrganizationFlags)
     status: int = Field(default_factory=_DefaultEnumHelpers.get_default_organization_status_value)
 
     default_role: str = ""
@@ -340,16 +359,11 @@ class RpcUserOrganizationContext(RpcModel):
     user_id: int | None = None
     # The organization is always non-null because the null wrapping is around this object instead.
     # A None organization => a None RpcUserOrganizationContext
-    organization: RpcOrganization = Field(default_factory=lambda: RpcOrganization())
+    organization: RpcOrganization = Field(default_factory=RpcOrganization)
     # member can be None when the given user_id does not have membership with the given organization.
     # Note that all related fields of this organization member are filtered by visibility and is_active=True.
     member: RpcOrganizationMember | None = None
 
-    def __post_init__(self) -> None:
-        # Ensures that outer user_id always agrees with the inner member object.
-        if self.user_id is not None and self.member is not None:
-            assert self.user_id == self.member.user_id
-
 
 class RpcUserInviteContext(RpcUserOrganizationContext):
     """
@@ -40,6 +40,8 @@ from sentry.users.services.user.model import RpcUser
 
 
 class OrganizationService(RpcService):
+    __slots__ = ()
+
     key = "organization"
     local_mode = SiloMode.REGION
 
@@ -24,7 +24,7 @@ leaky_bucket_info = redis.load_redis_script("ratelimits/leaky_bucket.lua")
 @dataclass
 class LeakyBucketLimitInfo:
     burst_limit: int  # maximum number of requests allowed in a burst
-    drip_rate: int  # number of requests allowed per second
+    drip_rate: float  # number of requests allowed per second
     last_drip: float = 0  # unix timestamp of the last drip
     current_level: float = 0  # current level of the bucket
     wait_time: float = 0  # seconds to wait until next request is allowed
@@ -37,7 +37,7 @@ class LeakyBucketRateLimiter:
         def __init__(self, info: LeakyBucketLimitInfo) -> None:
             self.info = info
 
-    def __init__(self, burst_limit: int, drip_rate: int, key: str | None = None) -> None:
+    def __init__(self, burst_limit: int, drip_rate: float, key: str | None = None) -> None:
         cluster_key = settings.SENTRY_RATE_LIMIT_REDIS_CLUSTER
         self.client = redis.redis_clusters.get(cluster_key)
         self.burst_limit = burst_limit
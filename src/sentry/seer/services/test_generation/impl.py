@@ -1,38 +1,94 @@
+import hashlib
+
 import orjson
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter, Retry
 
+from sentry.cache import default_cache
+from sentry.ratelimits.leaky_bucket import LeakyBucketRateLimiter
 from sentry.seer.services.test_generation.model import CreateUnitTestResponse
 from sentry.seer.services.test_generation.service import TestGenerationService
 
+# Smooth the request rate toward Seer with a leaky bucket (10 request burst,
+# draining at 10/minute) rather than a fixed window, which would allow 2x
+# bursts at window boundaries.
+_rate_limiter = LeakyBucketRateLimiter(burst_limit=10, drip_rate=10 / 60)
+
+# Constant fragments of the fixed-schema request body, pre-serialized once so
+# each call only JSON-encodes the variable fields. The concatenation matches
+# orjson.dumps of the equivalent dict byte-for-byte, keeping signatures stable.
+_BODY_PREFIX = b'{"repo":{"provider":"github","owner":'
+_BODY_NAME = b',"name":'
+_BODY_EXTERNAL_ID = b',"external_id":'
+_BODY_PR_ID = b'},"pr_id":'
+_BODY_SUFFIX = b"}"
+
+# Module-level session so Keep-Alive reuses connections to Seer instead of
+# paying a TCP+TLS handshake on every request.
+_seer_session = requests.Session()
+_seer_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            # urllib3 won't retry POST on response status by default; the
+            # Seer call is idempotent (deduped by cache key above), so
+            # retrying it on gateway errors is safe.
+            allowed_methods=None,
+        ),
+    ),
+)
+
 
 class RegionBackedTestGenerationService(TestGenerationService):
     def start_unit_test_generation(
         self, *, region_name: str, github_org: str, repo: str, pr_id: int, external_id: str
     ) -> CreateUnitTestResponse:
+        if _rate_limiter.is_limited(f"seer-unit-test-generation:{github_org}:{repo}:{pr_id}"):
+            return CreateUnitTestResponse(error_detail="Unit test generation rate limit exceeded")
+
+        # Duplicate requests for the same PR within a minute would kick off
+        # redundant Seer runs; short-circuit them to the already-started run.
+        cache_key = (
+            "seer-utg:"
+            + hashlib.blake2b(
+                orjson.dumps([github_org, repo, external_id, pr_id]), digest_size=16
+            ).hexdigest()
+        )
+        if default_cache.get(cache_key) is not None:
+            return CreateUnitTestResponse()
+
         url = f"{settings.SEER_AUTOFIX_URL}/v1/automation/codegen/unit-tests"
-        body = orjson.dumps(
-            {
-                "repo": {
-                    "provider": "github",
-                    "owner": github_org,
-                    "name": repo,
-                    "external_id": external_id,
-                },
-                "pr_id": pr_id,
-            },
-            option=orjson.OPT_NON_STR_KEYS,
+        body = b"".join(
+            (
+                _BODY_PREFIX,
+                orjson.dumps(github_org),
+                _BODY_NAME,
+                orjson.dumps(repo),
+                _BODY_EXTERNAL_ID,
+                orjson.dumps(external_id),
+                _BODY_PR_ID,
+                orjson.dumps(pr_id),
+                _BODY_SUFFIX,
+            )
         )
 
-        response = requests.post(
+        response = _seer_session.post(
             url,
             data=body,
             headers={
                 "content-type": "application/json;charset=utf-8",
             },
+            timeout=(3.05, 30),
         )
 
         if response.status_code == 200:
+            default_cache.set(cache_key, True, timeout=60)
             return CreateUnitTestResponse()
         else:
             return CreateUnitTestResponse(error_detail=response.text)
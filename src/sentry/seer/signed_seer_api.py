@@ -1,6 +1,7 @@
 import hashlib
 import hmac
 import logging
+from functools import lru_cache
 from random import random
 from typing import Any
 from urllib.parse import urlparse
@@ -54,16 +55,23 @@ def get_seer_salted_url(url: str) -> tuple[str, str]:
     return url, salt
 
 
+@lru_cache(maxsize=1)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    # The HMAC key schedule only depends on the secret, so set it up once and
+    # .copy() the template per request instead of rerunning it for every body.
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def sign_with_seer_secret(salt: str, body: bytes):
     auth_headers: dict[str, str] = {}
     if random() < options.get("seer.api.use-shared-secret"):
         if settings.SEER_API_SHARED_SECRET:
             # if random() < options.get("seer.api.use-nonce-signature"):
-            signature_input = b"%s:%s" % (salt.encode("utf8"), body)
-            signature = hmac.new(
-                settings.SEER_API_SHARED_SECRET.encode("utf-8"), signature_input, hashlib.sha256
-            ).hexdigest()
-            auth_headers["Authorization"] = f"Rpcsignature rpc0:{signature}"
+            h = _hmac_template(settings.SEER_API_SHARED_SECRET).copy()
+            h.update(salt.encode("utf8"))
+            h.update(b":")
+            h.update(body)
+            auth_headers["Authorization"] = f"Rpcsignature rpc0:{h.hexdigest()}"
         else:
             logger.warning(
                 "Seer.api.use-shared-secret is set but secret is not set. Unable to add auth headers for call to Seer."
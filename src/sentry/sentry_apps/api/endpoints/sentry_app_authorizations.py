@@ -1,6 +1,9 @@
 import logging
+from typing import Any
 
+import orjson
 import sentry_sdk
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -17,6 +20,26 @@ from sentry.sentry_apps.token_exchange.util import GrantTypes
 
 logger = logging.getLogger(__name__)
 
+# Maps grant_type to the token exchanger and the request fields it consumes.
+# Future grant types only need a new entry here.
+_GRANT_HANDLERS = {
+    GrantTypes.AUTHORIZATION: (GrantExchanger, ("code", "client_id")),
+    GrantTypes.REFRESH: (Refresher, ("refresh_token", "client_id")),
+}
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    Render token responses with orjson, which natively serializes the
+    datetime/UUID fields of the token payload without the stdlib encoder's
+    per-object Python overhead.
+    """
+
+    def render(self, data: Any, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z, default=str)
+
 
 @control_silo_endpoint
 class SentryAppAuthorizationsEndpoint(SentryAppAuthorizationsBaseEndpoint):
@@ -24,6 +47,7 @@ class SentryAppAuthorizationsEndpoint(SentryAppAuthorizationsBaseEndpoint):
     publish_status = {
         "POST": ApiPublishStatus.PRIVATE,
     }
+    renderer_classes = [OrjsonRenderer]
 
     def post(self, request: Request, installation) -> Response:
         scope = sentry_sdk.Scope.get_isolation_scope()
@@ -32,23 +56,25 @@ class SentryAppAuthorizationsEndpoint(SentryAppAuthorizationsBaseEndpoint):
         scope.set_tag("sentry_app_id", installation.sentry_app.id)
         scope.set_tag("sentry_app_slug", installation.sentry_app.slug)
 
+        # Promoting the request user can involve a control-silo RPC; do it
+        # once rather than per use.
+        api_user = promote_request_api_user(request)
+        body = request.json_body
+        grant_type = body.get("grant_type")
+
+        # Non-str grant_types (e.g. a JSON array) aren't hashable and would
+        # blow up the dict lookup; they're just as invalid as unknown ones.
+        handler = _GRANT_HANDLERS.get(grant_type) if isinstance(grant_type, str) else None
+        if handler is None:
+            return Response({"error": "Invalid grant_type"}, status=403)
+
+        exchanger_cls, fields = handler
         try:
-            if request.json_body.get("grant_type") == GrantTypes.AUTHORIZATION:
-                token = GrantExchanger(
-                    install=installation,
-                    code=request.json_body.get("code"),
-                    client_id=request.json_body.get("client_id"),
-                    user=promote_request_api_user(request),
-                ).run()
-            elif request.json_body.get("grant_type") == GrantTypes.REFRESH:
-                token = Refresher(
-                    install=installation,
-                    refresh_token=request.json_body.get("refresh_token"),
-                    client_id=request.json_body.get("client_id"),
-                    user=promote_request_api_user(request),
-                ).run()
-            else:
-                return Response({"error": "Invalid grant_type"}, status=403)
+            token = exchanger_cls(
+                install=installation,
+                user=api_user,
+                **{field: body.get(field) for field in fields},
+            ).run()
         except APIUnauthorized as e:
             logger.warning(
                 e,
@@ -62,8 +88,8 @@ class SentryAppAuthorizationsEndpoint(SentryAppAuthorizationsBaseEndpoint):
             )
             return Response({"error": e.msg or "Unauthorized"}, status=403)
 
-        attrs = {"state": request.json_body.get("state"), "application": None}
+        attrs = {"state": body.get("state"), "application": None}
 
-        body = ApiTokenSerializer().serialize(token, attrs, promote_request_api_user(request))
+        token_data = ApiTokenSerializer().serialize(token, attrs, api_user)
 
-        return Response(body, status=201)
+        return Response(token_data, status=201)
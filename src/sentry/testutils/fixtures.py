@@ -142,6 +142,9 @@ class Fixtures:
     def create_member(self, *args, **kwargs):
         return Factories.create_member(*args, **kwargs)
 
+    def bulk_create_members(self, *args, **kwargs):
+        return Factories.bulk_create_members(*args, **kwargs)
+
     def create_api_key(self, *args, **kwargs):
         return Factories.create_api_key(*args, **kwargs)
 
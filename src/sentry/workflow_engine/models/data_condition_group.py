@@ -20,3 +20,8 @@ class DataConditionGroup(DefaultFieldsModel):
 
     logic_type = models.CharField(max_length=200, choices=Type.choices, default=Type.ANY)
     organization = models.ForeignKey("sentry.Organization", on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=("organization", "logic_type")),
+        ]
@@ -15,7 +15,7 @@ from sentry.workflow_engine.models.data_source_detector import DataSourceDetecto
 T = TypeVar("T")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class DataPacket(Generic[T]):
     query_id: str
     packet: T
@@ -35,7 +35,22 @@ class DataSource(DefaultFieldsModel):
 
     detectors = models.ManyToManyField("workflow_engine.Detector", through=DataSourceDetector)
 
-    indexes = [
-        models.Index(fields=("type", "query_id")),
-        models.Index(fields=("organization", "type", "query_id")),
-    ]
+    class Meta:
+        # These were previously declared at class-body scope, where Django
+        # silently ignores them and never created the indexes.
+        indexes = [
+            # One partial index on query_id per type value; together these
+            # cover the same lookups as a composite (type, query_id) index
+            # with a smaller per-type B-tree.
+            models.Index(
+                fields=("query_id",),
+                condition=models.Q(type=1),  # Type.SNUBA_QUERY_SUBSCRIPTION
+                name="datasource_sub_query_idx",
+            ),
+            models.Index(
+                fields=("query_id",),
+                condition=models.Q(type=2),  # Type.SNUBA_QUERY
+                name="datasource_snuba_query_idx",
+            ),
+            models.Index(fields=("organization", "type", "query_id")),
+        ]
@@ -23,14 +23,14 @@ class SendRequestEmailTest(TestCase):
             team=team,
         )
 
-        self.create_member(organization=org, user=team_admin, role="admin", teams=[team])
-
-        self.create_member(organization=org, user=non_team_admin, role="admin", teams=[])
-
-        self.create_member(organization=org, user=random_member, role="member", teams=[team])
-
-        requesting_member = self.create_member(
-            organization=org, user=requesting_user, role="member", teams=[]
+        *_, requesting_member = self.bulk_create_members(
+            org,
+            [
+                (team_admin, "admin", [team]),
+                (non_team_admin, "admin", []),
+                (random_member, "member", [team]),
+                (requesting_user, "member", []),
+            ],
         )
 
         request = OrganizationAccessRequest.objects.create(member=requesting_member, team=team)
@@ -39,7 +39,7 @@ class SendRequestEmailTest(TestCase):
             request.send_request_email()
 
         assert len(mail.outbox) == 2, [m.subject for m in mail.outbox]
-        assert sorted(m.to[0] for m in mail.outbox) == sorted([owner.email, team_admin.email])
+        assert {m.to[0] for m in mail.outbox} == {owner.email, team_admin.email}
 
     @with_feature("system:multi-region")
     def test_sends_no_email_to_invited_member(self):
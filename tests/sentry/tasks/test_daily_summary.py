@@ -50,33 +50,37 @@ class DailySummaryTest(
         release=None,
         resolve=True,
         level="error",
+        count=1,
     ):
-        if category == DataCategory.ERROR:
-            data = {
-                "timestamp": timestamp.isoformat(),
-                "fingerprint": [fingerprint],
-                "level": level,
-                "exception": {
-                    "values": [
-                        {
-                            "type": "IntegrationError",
-                            "value": "Identity not found.",
-                        }
-                    ]
-                },
-            }
-            if release:
-                data["release"] = release
+        for _ in range(count):
+            if category == DataCategory.ERROR:
+                data = {
+                    "timestamp": timestamp.isoformat(),
+                    "fingerprint": [fingerprint],
+                    "level": level,
+                    "exception": {
+                        "values": [
+                            {
+                                "type": "IntegrationError",
+                                "value": "Identity not found.",
+                            }
+                        ]
+                    },
+                }
+                if release:
+                    data["release"] = release
 
-            event = self.store_event(
-                data=data,
-                project_id=project_id,
-                assert_no_errors=False,
-                default_event_type=EventType.DEFAULT,
-            )
-        elif category == DataCategory.TRANSACTION:
-            event = self.create_performance_issue()
+                event = self.store_event(
+                    data=data,
+                    project_id=project_id,
+                    assert_no_errors=False,
+                    default_event_type=EventType.DEFAULT,
+                )
+            elif category == DataCategory.TRANSACTION:
+                event = self.create_performance_issue()
 
+        # Events must be stored individually, but the outcomes insert
+        # batches into a single Snuba round-trip.
         self.store_outcomes(
             {
                 "org_id": self.organization.id,
@@ -86,7 +90,7 @@ class DailySummaryTest(
                 "timestamp": timestamp,
                 "key_id": 1,
             },
-            num_times=1,
+            num_times=count,
         )
 
         group = event.group
@@ -95,7 +99,9 @@ class DailySummaryTest(
             group.substatus = None
             group.resolved_at = timestamp + timedelta(minutes=1)
             group.save()
-        return group
+        # Hand back the last stored event too so callers don't have to
+        # re-fetch it from the event store via get_latest_event().
+        return group, event
 
     def setUp(self):
         responses.add_passthru(settings.SENTRY_SNUBA)
@@ -116,41 +122,41 @@ class DailySummaryTest(
     def populate_event_data(
         self, use_release=True, performance_issues=True, regressed_issue=True, escalated_issue=True
     ):
-        for _ in range(6):
-            self.group1 = self.store_event_and_outcomes(
-                self.project.id,
-                self.three_days_ago,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
-        for _ in range(4):
-            self.store_event_and_outcomes(
-                self.project.id,
-                self.two_days_ago,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
-        for _ in range(3):
-            self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        self.group1, _ = self.store_event_and_outcomes(
+            self.project.id,
+            self.three_days_ago,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=6,
+        )
+        self.store_event_and_outcomes(
+            self.project.id,
+            self.two_days_ago,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=4,
+        )
+        self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=3,
+        )
 
         # create an issue first seen in the release and set it to regressed
-        for _ in range(2):
-            self.group2 = self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-2",
-                category=DataCategory.ERROR,
-                release=self.release.version if use_release else None,
-                resolve=False,
-            )
+        self.group2, self.event2 = self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-2",
+            category=DataCategory.ERROR,
+            release=self.release.version if use_release else None,
+            resolve=False,
+            count=2,
+        )
         if regressed_issue:
             self.group2.substatus = GroupSubStatus.REGRESSED
             self.group2.save()
@@ -158,20 +164,20 @@ class DailySummaryTest(
                 self.group2,
                 ActivityType.SET_REGRESSION,
                 data={
-                    "event_id": self.group2.get_latest_event().event_id,
+                    "event_id": self.event2.event_id,
                     "version": self.release.version,
                 },
             )
         # create an issue and set it to escalating
-        for _ in range(10):
-            self.group3 = self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-3",
-                category=DataCategory.ERROR,
-                release=self.release.version if use_release else None,
-                resolve=False,
-            )
+        self.group3, self.event3 = self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-3",
+            category=DataCategory.ERROR,
+            release=self.release.version if use_release else None,
+            resolve=False,
+            count=10,
+        )
         if escalated_issue:
             self.group3.substatus = GroupSubStatus.ESCALATING
             self.group3.save()
@@ -179,20 +185,20 @@ class DailySummaryTest(
                 self.group3,
                 ActivityType.SET_ESCALATING,
                 data={
-                    "event_id": self.group3.get_latest_event().event_id,
+                    "event_id": self.event3.event_id,
                     "version": self.release.version,
                 },
             )
 
         # store an event in another project to be sure they're in separate buckets
-        for _ in range(2):
-            self.group4 = self.store_event_and_outcomes(
-                self.project2.id,
-                self.now,
-                fingerprint="group-4",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        self.group4, _ = self.store_event_and_outcomes(
+            self.project2.id,
+            self.now,
+            fingerprint="group-4",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=2,
+        )
         if performance_issues:
             # store some performance issues
             self.perf_event = self.create_performance_issue(
@@ -244,15 +250,15 @@ class DailySummaryTest(
 
         # add another release to make sure new issues in multiple releases show up
         release2 = self.create_release(project=self.project, date_added=self.now)
-        for _ in range(2):
-            release2_group = self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-12",
-                category=DataCategory.ERROR,
-                release=release2.version,
-                resolve=False,
-            )
+        release2_group, _ = self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-12",
+            category=DataCategory.ERROR,
+            release=release2.version,
+            resolve=False,
+            count=2,
+        )
         summary = build_summary_data(
             timestamp=self.now.timestamp(),
             duration=ONE_DAY,
@@ -293,32 +299,32 @@ class DailySummaryTest(
 
     @pytest.mark.skip(reason="flaky and part of a dead project")
     def test_build_summary_data_filter_to_unresolved(self):
-        for _ in range(3):
-            group1 = self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        group1, _ = self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=3,
+        )
 
-        for _ in range(3):
-            group2 = self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-2",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        group2, _ = self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-2",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=3,
+        )
 
-        for _ in range(3):
-            self.store_event_and_outcomes(
-                self.project.id,
-                self.now,
-                fingerprint="group-3",
-                category=DataCategory.ERROR,
-                resolve=True,
-            )
+        self.store_event_and_outcomes(
+            self.project.id,
+            self.now,
+            fingerprint="group-3",
+            category=DataCategory.ERROR,
+            resolve=True,
+            count=3,
+        )
 
         summary = build_summary_data(
             timestamp=self.now.timestamp(),
@@ -340,7 +346,7 @@ class DailySummaryTest(
     def test_build_summary_data_filter_to_error_level(self):
         """Test that non-error level issues are filtered out of the results"""
         for _ in range(3):
-            group1 = self.store_event_and_outcomes(
+            group1, _ = self.store_event_and_outcomes(
                 self.project.id,
                 self.now,
                 fingerprint="group-1",
@@ -348,14 +354,14 @@ class DailySummaryTest(
                 resolve=False,
                 level="info",
             )
-            group2 = self.store_event_and_outcomes(
+            group2, _ = self.store_event_and_outcomes(
                 self.project.id,
                 self.now,
                 fingerprint="group-2",
                 category=DataCategory.ERROR,
                 resolve=False,
             )
-            group3 = self.store_event_and_outcomes(
+            group3, _ = self.store_event_and_outcomes(
                 self.project.id,
                 self.now,
                 fingerprint="group-3",
@@ -392,7 +398,7 @@ class DailySummaryTest(
             self.group2,
             ActivityType.SET_REGRESSION,
             data={
-                "event_id": self.group2.get_latest_event().event_id,
+                "event_id": self.event2.event_id,
                 "version": self.release.version,
             },
         )
@@ -400,7 +406,7 @@ class DailySummaryTest(
             self.group3,
             ActivityType.SET_ESCALATING,
             data={
-                "event_id": self.group3.get_latest_event().event_id,
+                "event_id": self.event3.event_id,
                 "version": self.release.version,
             },
         )
@@ -426,7 +432,7 @@ class DailySummaryTest(
             self.group2,
             ActivityType.SET_ESCALATING,
             data={
-                "event_id": self.group2.get_latest_event().event_id,
+                "event_id": self.event2.event_id,
                 "version": self.release.version,
             },
         )
@@ -458,7 +464,7 @@ class DailySummaryTest(
             self.group2,
             ActivityType.SET_REGRESSION,
             data={
-                "event_id": self.group2.get_latest_event().event_id,
+                "event_id": self.event2.event_id,
                 "version": self.release.version,
             },
         )
@@ -469,7 +475,7 @@ class DailySummaryTest(
             self.group2,
             ActivityType.SET_ESCALATING,
             data={
-                "event_id": self.group2.get_latest_event().event_id,
+                "event_id": self.event2.event_id,
                 "version": self.release.version,
             },
         )
@@ -492,35 +498,35 @@ class DailySummaryTest(
         """
         Test that if a group has regressed or escalated some time in the past over 24 hours ago, it does not show up.
         """
-        for _ in range(2):
-            regressed_past_group = self.store_event_and_outcomes(
-                self.project.id,
-                self.three_days_ago,
-                fingerprint="group-12",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
-        for _ in range(2):
-            escalated_past_group = self.store_event_and_outcomes(
-                self.project.id,
-                self.three_days_ago,
-                fingerprint="group-13",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        regressed_past_group, regressed_past_event = self.store_event_and_outcomes(
+            self.project.id,
+            self.three_days_ago,
+            fingerprint="group-12",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=2,
+        )
+        escalated_past_group, escalated_past_event = self.store_event_and_outcomes(
+            self.project.id,
+            self.three_days_ago,
+            fingerprint="group-13",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=2,
+        )
         with freeze_time(self.two_days_ago):
             Activity.objects.create_group_activity(
                 regressed_past_group,
                 ActivityType.SET_REGRESSION,
                 data={
-                    "event_id": regressed_past_group.get_latest_event().event_id,
+                    "event_id": regressed_past_event.event_id,
                 },
             )
             Activity.objects.create_group_activity(
                 escalated_past_group,
                 ActivityType.SET_ESCALATING,
                 data={
-                    "event_id": escalated_past_group.get_latest_event().event_id,
+                    "event_id": escalated_past_event.event_id,
                 },
             )
         summary = build_summary_data(
@@ -577,13 +583,13 @@ class DailySummaryTest(
             name="barf", organization=self.organization, teams=[self.team]
         )
         project3.first_event = self.three_days_ago
-        for _ in range(15):
-            self.store_event_and_outcomes(
-                project3.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-            )
+        self.store_event_and_outcomes(
+            project3.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            count=15,
+        )
         context = build_summary_data(
             timestamp=self.now.timestamp(),
             duration=ONE_DAY,
@@ -600,22 +606,22 @@ class DailySummaryTest(
         project3 = self.create_project(name="meow", organization=self.organization, teams=[team2])
         project3.first_event = self.three_days_ago
         # make the event count higher than self.project and self.project2
-        for _ in range(15):
-            self.store_event_and_outcomes(
-                project3.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-            )
+        self.store_event_and_outcomes(
+            project3.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            count=15,
+        )
         project4 = self.create_project(name="woof", organization=self.organization, teams=[team2])
         project4.first_event = self.three_days_ago
-        for _ in range(15):
-            self.store_event_and_outcomes(
-                project4.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-            )
+        self.store_event_and_outcomes(
+            project4.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            count=15,
+        )
 
         user2 = self.create_user()
         self.create_member(teams=[self.team], user=user2, organization=self.organization)
@@ -888,14 +894,14 @@ class DailySummaryTest(
         )
         project3.first_event = self.three_days_ago
         project3.save()
-        for _ in range(15):
-            self.store_event_and_outcomes(
-                project3.id,
-                self.now,
-                fingerprint="group-1",
-                category=DataCategory.ERROR,
-                resolve=False,
-            )
+        self.store_event_and_outcomes(
+            project3.id,
+            self.now,
+            fingerprint="group-1",
+            category=DataCategory.ERROR,
+            resolve=False,
+            count=15,
+        )
         context = build_summary_data(
             timestamp=self.now.timestamp(),
             duration=ONE_DAY,